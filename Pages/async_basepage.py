@@ -0,0 +1,176 @@
+import json
+from contextlib import asynccontextmanager
+
+import trio
+from selenium.common import (
+    InvalidElementStateException,
+    JavascriptException,
+    NoSuchElementException,
+    WebDriverException,
+)
+
+from utils.locator_scripts import SET_VALUE_FUNCTION, lookup_expression
+
+_CALL_EXPRESSION = (
+    "(function (el, args) {"
+    " if (!el) { return {found: false}; }"
+    " return {found: true, value: (%s).apply(el, args)};"
+    " })(%s, %s)"
+)
+
+_CLICK_FUNCTION = "function () { this.click(); }"
+
+_TEXT_FUNCTION = "function () { return this.innerText; }"
+
+_ATTRIBUTE_FUNCTION = "function (name) { return this.getAttribute(name); }"
+
+
+class AsyncBasePage:
+    """
+    Page helpers that talk to Chromium over a single CDP connection so that independent commands can be pipelined.
+
+    Every helper is one Runtime.evaluate command, so running several of them concurrently (e.g., with fill_form)
+    costs roughly one round-trip instead of one per field. Only Chromium-based drivers expose CDP, and the helpers
+    must run inside trio.
+
+    The CDP connection attaches to the browser's first page target and evaluates in its top-level document, not in
+    the driver's current window or frame, so connect() refuses drivers with more than one window open or switched
+    into a frame.
+
+    Usage:
+        async def book():
+            async with AsyncBasePage.connect(driver) as page:
+                await page.fill_form({(By.ID, 'name'): 'Alice', (By.ID, 'email'): 'alice@example.com'})
+
+        trio.run(book)
+    """
+
+    def __init__(self, connection):
+        """
+        Initializes a new instance of the AsyncBasePage class.
+
+        Parameters:
+            connection (BidiConnection): An open connection from WebDriver.bidi_connection().
+        """
+        self.session = connection.session
+        self.devtools = connection.devtools
+
+    @classmethod
+    @asynccontextmanager
+    async def connect(cls, driver):
+        """
+        Opens a CDP connection to the driver's browser and yields a page bound to it.
+
+        Parameters:
+            driver (WebDriver): A Chromium-based Selenium WebDriver instance.
+
+        Raises:
+            WebDriverException: If the driver has more than one window open or is switched into a frame.
+        """
+        if len(driver.window_handles) > 1:
+            raise WebDriverException("AsyncBasePage cannot tell which window to use when several are open.")
+        if not driver.execute_script("return window.top === window.self;"):
+            raise WebDriverException("AsyncBasePage only sees the top-level document; switch out of the frame first.")
+        async with driver.bidi_connection() as connection:
+            yield cls(connection)
+
+    async def _call(self, by, value, function, *args):
+        """
+        Calls a JavaScript function with the located element as 'this' and returns its JSON result.
+
+        Raises:
+            NoSuchElementException: If no element matches the locator.
+            JavascriptException: If the function throws in the page.
+        """
+        expression = _CALL_EXPRESSION % (function, lookup_expression(by, value), json.dumps(list(args)))
+        result, exception = await self.session.execute(
+            self.devtools.runtime.evaluate(expression=expression, return_by_value=True)
+        )
+        if exception is not None:
+            raise JavascriptException(exception.text)
+        if not result.value["found"]:
+            raise NoSuchElementException(f"No element found for locator ({by!r}, {value!r}).")
+        return result.value.get("value")
+
+    async def click_element(self, by, value):
+        """
+        Clicks the element identified by the specified method and value.
+
+        Parameters:
+            by: The method used to locate the element (By.ID, By.CSS_SELECTOR or By.XPATH).
+            value: The value of the method (e.g., the ID, CSS selector, or XPath expression).
+
+        Usage:
+            await page.click_element(By.ID, 'exampleId')
+        """
+        await self._call(by, value, _CLICK_FUNCTION)
+
+    async def input_text(self, by, value, text):
+        """
+        Replaces the value of the identified input element and fires its 'input' and 'change' events.
+
+        The element is not focused, so concurrent calls do not fire focus and blur handlers in arbitrary order.
+
+        Parameters:
+            by: The method used to locate the element (By.ID, By.CSS_SELECTOR or By.XPATH).
+            value: The value of the method (e.g., the ID, CSS selector, or XPath expression).
+            text: The text to input into the element.
+
+        Raises:
+            InvalidElementStateException: If the element is not an editable input or textarea.
+
+        Usage:
+            await page.input_text(By.ID, 'exampleId', 'Hello, World!')
+        """
+        if not await self._call(by, value, SET_VALUE_FUNCTION, str(text)):
+            raise InvalidElementStateException(f"Element ({by!r}, {value!r}) is not an editable input or textarea.")
+
+    async def get_element_text(self, by, value):
+        """
+        Retrieves the rendered text content of the identified element.
+
+        Parameters:
+            by: The method used to locate the element (By.ID, By.CSS_SELECTOR or By.XPATH).
+            value: The value of the method (e.g., the ID, CSS selector, or XPath expression).
+
+        Returns:
+            str: The text content of the element.
+
+        Usage:
+            text_content = await page.get_element_text(By.ID, 'exampleId')
+        """
+        return await self._call(by, value, _TEXT_FUNCTION)
+
+    async def get_element_attribute(self, by, value, attribute):
+        """
+        Retrieves the value of a specified attribute of the identified element.
+
+        Unlike BasePage.get_element_attribute, this reads the HTML attribute only, not live DOM properties such as the
+        current value of an input.
+
+        Parameters:
+            by: The method used to locate the element (By.ID, By.CSS_SELECTOR or By.XPATH).
+            value: The value of the method (e.g., the ID, CSS selector, or XPath expression).
+            attribute: The name of the attribute whose value is to be retrieved.
+
+        Returns:
+            str or None: The value of the specified attribute, or None if the attribute is not present.
+
+        Usage:
+            attribute_value = await page.get_element_attribute(By.ID, 'exampleId', 'class')
+        """
+        return await self._call(by, value, _ATTRIBUTE_FUNCTION, attribute)
+
+    async def fill_form(self, fields):
+        """
+        Inputs text into several fields concurrently, pipelining the commands over the CDP connection.
+
+        Parameters:
+            fields (dict): A mapping of (by, value) locators to the text to input into each field.
+
+        Usage:
+            await page.fill_form({(By.ID, 'firstName'): 'Ada', (By.ID, 'lastName'): 'Lovelace'})
+        """
+        async with trio.open_nursery() as nursery:
+            for (by, value), text in fields.items():
+                nursery.start_soon(self.input_text, by, value, text)
@@ -1,19 +1,379 @@
-from selenium.common import TimeoutException, NoSuchWindowException
+import base64
+import functools
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+import trio
+from selenium.common import (
+    TimeoutException, NoSuchWindowException, NoSuchElementException, StaleElementReferenceException,
+    WebDriverException
+)
 from selenium.webdriver import ActionChains, Keys
+from selenium.webdriver.common.by import By
 from selenium.webdriver.support.select import Select
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from Pages.async_basepage import AsyncBasePage
+from utils.locator_scripts import SCRIPT_LOCATORS, SET_VALUE_FUNCTION, lookup_expression, resolve_many_script
+
+DEFAULT_TIMEOUT = 10
+POLL_FREQUENCY = 0.1
+
+_MODIFIER_KEYS = frozenset((Keys.SHIFT, Keys.CONTROL, Keys.ALT, Keys.META, Keys.COMMAND))
+
+_PRES = EC.presence_of_element_located
+_VIS = EC.visibility_of_element_located
+_CLK = EC.element_to_be_clickable
+_ALERT = EC.alert_is_present
+_ALL = EC.presence_of_all_elements_located
+
+_SCROLL_INTO_VIEW_SCRIPT = "var el = %s; if (el) { el.scrollIntoView(true); } return !!el;"
+
+_CLICK_ALL_SCRIPT = """
+var elements = document.querySelectorAll(arguments[0]);
+var index = arguments[1];
+if (index === null) {
+    elements.forEach(function (element) { element.click(); });
+} else if (index < elements.length) {
+    elements[index].click();
+}
+return elements.length;
+"""
+
+_ATTRIBUTES_SCRIPT = """
+var attributes = {};
+for (var i = 0; i < arguments[0].attributes.length; i++) {
+    attributes[arguments[0].attributes[i].name] = arguments[0].attributes[i].value;
+}
+return attributes;
+"""
+
+_SET_VALUE_SCRIPT = "return (%s).call(arguments[0], arguments[1]);" % SET_VALUE_FUNCTION
+
+_OPTION_TEXTS_SCRIPT = "return Array.from(arguments[0].options).map(function (option) { return option.text; });"
+
+# Selects the options whose text is in arguments[1]. Selects nothing and reports the offending texts when a
+# requested text matches no option or only a disabled one.
+_SELECT_OPTIONS_SCRIPT = """
+var select = arguments[0];
+var wanted = new Set(arguments[1]);
+var matched = [], found = new Set(), disabled = [];
+for (var i = 0; i < select.options.length; i++) {
+    var option = select.options[i];
+    if (wanted.has(option.text)) {
+        found.add(option.text);
+        if (option.disabled) {
+            disabled.push(option.text);
+        } else {
+            matched.push(option);
+        }
+    }
+}
+var missing = arguments[1].filter(function (text) { return !found.has(text); });
+if (missing.length || disabled.length) {
+    return {missing: missing, disabled: disabled};
+}
+matched.forEach(function (option) { option.selected = true; });
+select.dispatchEvent(new Event('input', {bubbles: true}));
+select.dispatchEvent(new Event('change', {bubbles: true}));
+return {missing: [], disabled: []};
+"""
+
+_SCROLL_AND_CLICK_SCRIPT = """
+arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});
+arguments[0].click();
+"""
+
+# Resolves with true once the URL matches, or false when the deadline passes, checking inside the page. Resolves
+# with null straight away inside a frame, whose location is not the top-level URL the driver reports.
+_WAIT_FOR_URL_SCRIPT = """
+var done = arguments[arguments.length - 1];
+var expected = arguments[0], exact = arguments[1], deadline = Date.now() + arguments[2];
+if (window.top !== window.self) {
+    done(null);
+    return;
+}
+(function check() {
+    var url = window.location.href;
+    if (exact ? url === expected : url.indexOf(expected) !== -1) {
+        done(true);
+    } else if (Date.now() >= deadline) {
+        done(false);
+    } else {
+        setTimeout(check, 20);
+    }
+})();
+"""
+
+_WINDOW_META_SCRIPT = "return [document.title, window.location.href, window.top === window.self];"
+
+
+def _has_key_codes(text):
+    """
+    Tells whether the text contains Keys.* values, which live in the Unicode private use area.
+    """
+    return any("\ue000" <= char <= "\uf8ff" for char in str(text))
+
+
+def _retry_stale(max_attempts=2):
+    """
+    Retries the decorated BasePage method when the element it used went stale mid-call.
+
+    The element cache is dropped before retrying and the wrapped method re-resolves its locators on every attempt,
+    so a retry picks up the re-rendered element.
+
+    Parameters:
+        max_attempts (int): The total number of attempts before the exception is re-raised (default is 2).
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            for attempt in range(max_attempts):
+                try:
+                    return method(self, *args, **kwargs)
+                except StaleElementReferenceException:
+                    self._elements.clear()
+                    if attempt == max_attempts - 1:
+                        raise
+        return wrapper
+    return decorator
+
+
+def _mutates_page(method):
+    """
+    Drops the element cache after the decorated BasePage method, since it may change which elements match a locator.
+
+    A click or keystroke can move state such as '.active', ':checked' or 'li:last-child' to another element while the
+    cached one stays attached, so only lookups chained between interactions reuse cached elements.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._elements.clear()
+    return wrapper
+
 
 class BasePage:
-    def __init__(self, driver):
+    """
+    Common page-object helpers shared by every page in the framework.
+
+    BasePage declares __slots__, so its own instances have no per-instance __dict__. Subclasses that do not declare
+    __slots__ get a __dict__ as usual and can keep setting page-specific attributes; declaring __slots__ with their
+    own attribute names keeps them dict-free as well.
+    """
+
+    __slots__ = ('driver', '_poll', '_waits', '_elements', '_handle_meta', '_http')
+
+    # How long, in seconds, a located element is reused for the same locator without asking the driver again.
+    ELEMENT_CACHE_TTL = 0.5
+
+    @classmethod
+    def for_parallel(cls, driver_factory, n_workers, **kwargs):
+        """
+        Creates independent page instances, each driving its own browser, for use from parallel workers.
+
+        The drivers are started concurrently since browser start-up dominates the cost. A page instance
+        only touches its own driver, so each one can be used from a separate thread. If any driver fails to
+        start, the ones that did start are quit before the error is re-raised.
+
+        Parameters:
+            driver_factory (Callable[[], WebDriver]): Returns a new WebDriver on every call.
+            n_workers (int): The number of page instances (and browsers) to create.
+            **kwargs: Extra keyword arguments passed to the page constructor (e.g., poll_frequency).
+
+        Returns:
+            List[BasePage]: One page instance per worker.
+
+        Usage:
+            pages = BasePage.for_parallel(create_driver, 4)
+        """
+        with ThreadPoolExecutor(max_workers=n_workers) as pool:
+            futures = [pool.submit(driver_factory) for _ in range(n_workers)]
+        errors = [future.exception() for future in futures if future.exception() is not None]
+        if errors:
+            for future in futures:
+                if future.exception() is None:
+                    future.result().quit()
+            raise errors[0]
+        return [cls(future.result(), **kwargs) for future in futures]
+
+    def __init__(self, driver, poll_frequency=POLL_FREQUENCY):
         """
         Initializes a new instance of the BasePage class.
 
         Parameters:
             driver (WebDriver): The Selenium WebDriver instance for browser automation.
+            poll_frequency (float): How often explicit waits re-check their condition, in seconds
+                (default is 0.1). Lower values notice elements sooner at the cost of more driver
+                round-trips while waiting; Selenium's own default is 0.5.
         """
         self.driver = driver
+        self._poll = poll_frequency
+        self._waits = {}
+        self._elements = {}
+        self._handle_meta = {}
+        self._http = requests.Session()
+
+    def _wait(self, timeout=DEFAULT_TIMEOUT, poll=None):
+        """
+        Returns a WebDriverWait for the given timeout and poll interval, reusing a cached instance when one exists.
+
+        Parameters:
+            timeout (int): The maximum time the wait should poll for (default is 10 seconds).
+            poll (float or None): The poll interval in seconds; defaults to the page's poll_frequency.
+
+        Returns:
+            WebDriverWait: The cached WebDriverWait bound to this page's driver.
+        """
+        key = (timeout, self._poll if poll is None else poll)
+        wait = self._waits.get(key)
+        if wait is None:
+            wait = self._waits[key] = WebDriverWait(
+                self.driver, timeout, poll_frequency=key[1],
+                ignored_exceptions=(NoSuchElementException, StaleElementReferenceException),
+            )
+        return wait
+
+    def _alert(self, timeout=DEFAULT_TIMEOUT):
+        """
+        Waits for an alert to be present and returns it.
+
+        Parameters:
+            timeout (int): The maximum time to wait for the alert (default is 10 seconds).
+
+        Returns:
+            Alert: The Alert object.
+        """
+        return self._wait(timeout).until(_ALERT())
+
+    def _cdp(self, method, params):
+        """
+        Sends a Chrome DevTools Protocol command through the driver.
+
+        Parameters:
+            method (str): The CDP method name (e.g., 'Runtime.evaluate').
+            params (dict): The parameters of the command.
+
+        Returns:
+            dict: The result of the command.
+        """
+        return self.driver.execute_cdp_cmd(method, params)
+
+    def _find(self, by, value, timeout=DEFAULT_TIMEOUT):
+        """
+        Finds an element directly, falling back to an explicit wait only if it is not present yet.
+
+        An element found for the same locator within the last ELEMENT_CACHE_TTL seconds is returned without a driver
+        call. The cache is dropped whenever the page or browsing context changes and after every interaction
+        (methods decorated with _mutates_page), and methods decorated with _retry_stale drop it and look the element
+        up again if it went stale.
+
+        Parameters:
+            by: The method used to locate the element (e.g., By. ID, By.NAME, By.XPATH, etc.).
+            value: The value of the method (e.g., the ID, name, or XPath expression).
+            timeout (int): The maximum time to wait if the element is not immediately present (default is 10 seconds).
+
+        Returns:
+            WebElement: The located WebElement.
+        """
+        key = (by, value)
+        now = time.monotonic()
+        cached = self._elements.get(key)
+        if cached is not None and now - cached[0] < self.ELEMENT_CACHE_TTL:
+            return cached[1]
+        try:
+            element = self.driver.find_element(by, value)
+        except NoSuchElementException:
+            element = self._wait(timeout).until(_PRES(key))
+        self._elements[key] = (time.monotonic(), element)
+        return element
+
+    def _wait_for_url(self, expected, exact, timeout):
+        """
+        Waits for the URL to contain (or, if exact, equal) the expected URL.
+
+        The check first runs inside the page as one asynchronous script, so client-side URL changes are seen without
+        polling the driver. A full navigation unloads that script, in which case the remaining time is spent polling
+        with an explicit wait. Inside a frame the script only sees the frame's URL, so the explicit wait is used
+        straight away.
+
+        Returns:
+            bool: True once the URL matches.
+
+        Raises:
+            TimeoutException: If the URL does not match within the timeout.
+        """
+        started = time.monotonic()
+        try:
+            if self.driver.execute_async_script(_WAIT_FOR_URL_SCRIPT, expected, exact, timeout * 1000):
+                return True
+        except WebDriverException:
+            pass
+        remaining = max(timeout - (time.monotonic() - started), 0)
+        condition = EC.url_to_be(expected) if exact else EC.url_contains(expected)
+        # Not taken from the _wait cache: the remaining time differs on every call.
+        return WebDriverWait(self.driver, remaining, poll_frequency=self._poll).until(condition)
+
+    def _remember_window(self, handle):
+        """
+        Records the title and URL of the current window, which must be the one identified by handle.
+
+        Parameters:
+            handle (str): The handle of the current window.
+
+        Returns:
+            tuple: The (title, url) pair of the window.
+        """
+        meta = self._handle_meta[handle] = tuple(self.driver.execute_script(_WINDOW_META_SCRIPT)[:2])
+        return meta
+
+    def _switch_to_window_matching(self, field, expected):
+        """
+        Switches to another window whose title or URL contains the expected text.
+
+        Windows seen before are checked from the cached (title, url) pairs first, and only if none of them
+        still matches are the remaining windows inspected one by one. The original window is restored
+        when nothing matches.
+
+        Parameters:
+            field (int): 0 to match on the window title, 1 to match on the window URL.
+            expected (str): The text the title or URL should contain.
+
+        Returns:
+            bool: True if a matching window was found and switched to, False otherwise.
+        """
+        self._elements.clear()
+        current_handle = self.driver.current_window_handle
+        checked = {current_handle}
+        for handle, meta in list(self._handle_meta.items()):
+            if handle in checked or expected not in meta[field]:
+                continue
+            checked.add(handle)
+            try:
+                self.driver.switch_to.window(handle)
+            except NoSuchWindowException:
+                del self._handle_meta[handle]
+                continue
+            if expected in self._remember_window(handle)[field]:
+                return True
+
+        handles = self.driver.window_handles
+        for handle in set(self._handle_meta) - set(handles):
+            del self._handle_meta[handle]
+        for handle in handles:
+            if handle in checked:
+                continue
+            self.driver.switch_to.window(handle)
+            if expected in self._remember_window(handle)[field]:
+                return True
+
+        self.driver.switch_to.window(current_handle)
+        return False
 
     def navigate_to_url(self, url):
         """
@@ -22,6 +382,7 @@ class BasePage:
         Parameters:
             url (str): The URL to navigate to.
         """
+        self._elements.clear()
         self.driver.get(url)
 
     def get_cookie(self, cookie_name):
@@ -115,7 +476,7 @@ class BasePage:
         """
         return self.driver.get_window_position()
 
-    def wait_for_element(self, by, value, timeout=10):
+    def wait_for_element(self, by, value, timeout=DEFAULT_TIMEOUT):
         """
         Waits for the presence of an element identified by the specified method and value.
 
@@ -130,7 +491,34 @@ class BasePage:
         Usage:
             element = base_page.wait_for_element(By.ID, 'exampleId')
         """
-        return WebDriverWait(self.driver, timeout).until(EC.presence_of_element_located((by, value)))
+        return self._wait(timeout).until(_PRES((by, value)))
+
+    def find_many(self, locators):
+        """
+        Locates several elements at once, using a single script call when every locator is an ID, CSS selector or
+        XPath expression. Other locator strategies, and elements that are not present yet, are located one by one.
+
+        Parameters:
+            locators (List[tuple]): A list of (by, value) pairs.
+
+        Returns:
+            List[WebElement]: The located elements, in the same order as the locators.
+
+        Usage:
+            source, target = base_page.find_many([(By.ID, 'source'), (By.CSS_SELECTOR, '#target')])
+        """
+        if not all(by in SCRIPT_LOCATORS for by, _ in locators):
+            return [self._find(by, value) for by, value in locators]
+        elements = self.driver.execute_script(resolve_many_script(tuple(locators)))
+        found_at = time.monotonic()
+        located = []
+        for element, (by, value) in zip(elements, locators):
+            if element is None:
+                element = self._find(by, value)
+            else:
+                self._elements[(by, value)] = (found_at, element)
+            located.append(element)
+        return located
 
     def get_element_location(self, by, value):
         """
@@ -146,8 +534,8 @@ class BasePage:
         Usage:
             location = base_page.get_element_location(By.ID, 'exampleId')
         """
-        element = self.wait_for_element(by, value)
-        return element.location
+        rect = self.get_element_rect(by, value)
+        return {"x": round(rect["x"]), "y": round(rect["y"])}
 
     def get_element_size(self, by, value):
         """
@@ -163,9 +551,28 @@ class BasePage:
         Usage:
             size = base_page.get_element_size(By.ID, 'exampleId')
         """
-        element = self.wait_for_element(by, value)
-        return element.size
+        rect = self.get_element_rect(by, value)
+        return {"height": rect["height"], "width": rect["width"]}
+
+    @_retry_stale()
+    def get_element_rect(self, by, value):
+        """
+        Retrieves the location and size of an element identified by the specified method and value in one call.
+
+        Parameters:
+            by: The method used to locate the element (e.g., By. ID, By.NAME, By.XPATH, etc.).
+            value: The value of the method (e.g., the ID, name, or XPath expression).
+
+        Returns:
+            dict: A dictionary with 'x', 'y', 'width' and 'height' keys.
+
+        Usage:
+            rect = base_page.get_element_rect(By.ID, 'exampleId')
+        """
+        return self._find(by, value).rect
 
+    @_mutates_page
+    @_retry_stale()
     def click_element(self, by, value):
         """
         Waits for the presence of an element and then clicks it.
@@ -177,26 +584,59 @@ class BasePage:
         Usage:
             base_page.click_element(By.ID, 'exampleId')
         """
-        element = self.wait_for_element(by, value)
+        element = self._find(by, value)
         element.click()
 
-    def input_text(self, by, value, text):
+    @_mutates_page
+    @_retry_stale()
+    def input_text(self, by, value, text, fast=True):
         """
-        Waits for the presence of an element, clears its content, and inputs the specified text.
+        Waits for the presence of an element and replaces its content with the specified text.
+
+        By default the value is set in one script call that fires a single 'input' and 'change' event. The text is
+        typed key by key instead when fast=False, when it contains Keys.* values, or when the element is not an
+        editable input or textarea (e.g., contenteditable editors, readonly or disabled fields), so those cases
+        behave exactly like input_text_keys.
 
         Parameters:
             by: The method used to locate the element (e.g., By. ID, By.NAME, By.XPATH, etc.).
             value: The value of the method (e.g., the ID, name, or XPath expression).
             text: The text to input into the element.
+            fast (bool): Whether to set the value directly instead of typing it key by key (default is True).
 
         Usage:
             base_page.input_text(By.ID, 'exampleId', 'Hello, World!')
         """
-        element = self.wait_for_element(by, value)
+        element = self._find(by, value)
+        if fast and not _has_key_codes(text) and self.driver.execute_script(_SET_VALUE_SCRIPT, element, str(text)):
+            return
+        self._type_keys(element, text)
+
+    @_mutates_page
+    @_retry_stale()
+    def input_text_keys(self, by, value, text):
+        """
+        Waits for the presence of an element, clears its content, and types the specified text key by key.
+
+        Parameters:
+            by: The method used to locate the element (e.g., By. ID, By.NAME, By.XPATH, etc.).
+            value: The value of the method (e.g., the ID, name, or XPath expression).
+            text: The text to input into the element.
+
+        Usage:
+            base_page.input_text_keys(By.ID, 'exampleId', 'Hello, World!')
+        """
+        self._type_keys(self._find(by, value), text)
+
+    @staticmethod
+    def _type_keys(element, text):
+        """
+        Clears the element and types the text key by key, so Keys.* values are sent as key presses.
+        """
         element.clear()
         element.send_keys(text)
 
-    def wait_for_visible_element(self, by, value, timeout=10):
+    def wait_for_visible_element(self, by, value, timeout=DEFAULT_TIMEOUT):
         """
         Waits for the visibility of an element identified by the specified method and value.
 
@@ -211,9 +651,9 @@ class BasePage:
         Usage:
             element = base_page.wait_for_visible_element(By.ID, 'exampleId')
         """
-        return WebDriverWait(self.driver, timeout).until(EC.visibility_of_element_located((by, value)))
+        return self._wait(timeout).until(_VIS((by, value)))
 
-    def wait_for_invisible_element(self, by, value, timeout=10):
+    def wait_for_invisible_element(self, by, value, timeout=DEFAULT_TIMEOUT):
         """
         Waits for the invisibility of an element identified by the specified method and value.
 
@@ -228,8 +668,52 @@ class BasePage:
         Usage:
             is_invisible = base_page.wait_for_invisible_element(By.ID, 'exampleId')
         """
-        return WebDriverWait(self.driver, timeout).until_not(EC.presence_of_element_located((by, value)))
+        return self._wait(timeout).until_not(_PRES((by, value)))
+
+    @_mutates_page
+    def fill_form(self, fields):
+        """
+        Inputs text into several fields at once, sending the commands concurrently over a CDP connection.
+
+        Only supported on Chromium-based drivers. The fields are filled as with AsyncBasePage.input_text, i.e. by
+        setting their value and firing 'input' and 'change' events rather than typing key by key. The CDP connection
+        works on the top-level document of the browser's first tab, so the driver must have a single window open and
+        must not be switched into a frame; use input_text otherwise.
+
+        Parameters:
+            fields (dict): A mapping of (by, value) locators to the text to input into each field.
+
+        Raises:
+            WebDriverException: If several windows are open or the driver is inside a frame.
+            InvalidElementStateException: If a field is not an editable input or textarea.
+
+        Usage:
+            base_page.fill_form({(By.ID, 'firstName'): 'Ada', (By.ID, 'lastName'): 'Lovelace'})
+        """
+        async def fill():
+            async with AsyncBasePage.connect(self.driver) as page:
+                await page.fill_form(fields)
+
+        trio.run(fill)
+
+    def wait_for_absence(self, by, value, timeout=2):
+        """
+        Waits until no visible element matches the specified method and value.
+
+        Parameters:
+            by: The method used to locate the element (e.g., By. ID, By.NAME, By.XPATH, etc.).
+            value: The value of the method (e.g., the ID, name, or XPath expression).
+            timeout (int): The maximum time to wait for the element to disappear (default is 2 seconds).
+
+        Returns:
+            bool: True once the element is absent or hidden.
+
+        Usage:
+            base_page.wait_for_absence(By.ID, 'loadingSpinner')
+        """
+        return self._wait(timeout).until(EC.invisibility_of_element_located((by, value)))
 
+    @_retry_stale()
     def get_element_text(self, by, value):
         """
         Retrieves the text content of an element identified by the specified method and value.
@@ -244,9 +728,10 @@ class BasePage:
         Usage:
             text_content = base_page.get_element_text(By.ID, 'exampleId')
         """
-        element = self.wait_for_element(by, value)
+        element = self._find(by, value)
         return element.text
 
+    @_retry_stale()
     def get_element_attribute(self, by, value, attribute):
         """
         Retrieves the value of a specified attribute of an element identified by the specified method and value.
@@ -262,9 +747,32 @@ class BasePage:
         Usage:
             attribute_value = base_page.get_element_attribute(By.ID, 'exampleId', 'class')
         """
-        element = self.wait_for_element(by, value)
+        element = self._find(by, value)
         return element.get_attribute(attribute)
 
+    @_retry_stale()
+    def get_element_attributes(self, by, value):
+        """
+        Retrieves all attributes of an element identified by the specified method and value in one call.
+
+        Unlike get_element_attribute, this reads the HTML attributes only, not live DOM properties such as the
+        current value of an input.
+
+        Parameters:
+            by: The method used to locate the element (e.g., By. ID, By.NAME, By.XPATH, etc.).
+            value: The value of the method (e.g., the ID, name, or XPath expression).
+
+        Returns:
+            dict: A dictionary mapping attribute names to their values.
+
+        Usage:
+            attributes = base_page.get_element_attributes(By.ID, 'exampleId')
+        """
+        element = self._find(by, value)
+        return self.driver.execute_script(_ATTRIBUTES_SCRIPT, element)
+
+    @_mutates_page
+    @_retry_stale()
     def select_dropdown_option_by_visible_text(self, by, value, option_text):
         """
         Waits for the presence of a dropdown element, selects an option by visible text.
@@ -277,10 +785,12 @@ class BasePage:
         Usage:
             base_page.select_dropdown_option_by_visible_text(By.ID, 'exampleDropdown', 'Option 1')
         """
-        element = self.wait_for_element(by, value)
+        element = self._find(by, value)
         select = Select(element)
         select.select_by_visible_text(option_text)
 
+    @_mutates_page
+    @_retry_stale()
     def select_dropdown_option_by_value(self, by, value, option_value):
         """
         Waits for the presence of a dropdown element and selects an option by its value.
@@ -293,10 +803,11 @@ class BasePage:
         Usage:
             base_page.select_dropdown_option_by_value(By.ID, 'exampleDropdown', 'optionValue1')
         """
-        element = self.wait_for_element(by, value)
+        element = self._find(by, value)
         select = Select(element)
         select.select_by_value(option_value)
 
+    @_retry_stale()
     def get_selected_option_text(self, by, value):
         """
         Retrieves the text of the currently selected option in a dropdown element.
@@ -311,17 +822,23 @@ class BasePage:
         Usage:
             selected_text = base_page.get_selected_option_text(By.ID, 'exampleDropdown')
         """
-        element = self.wait_for_element(by, value)
+        element = self._find(by, value)
         select = Select(element)
         return select.first_selected_option.text
 
-    def is_element_displayed(self, by, value):
+    def is_element_displayed(self, by, value, timeout=None, settle_timeout=1):
         """
         Checks if an element identified by the specified method and value is displayed on the page.
 
+        With a timeout the check waits up to that long for the element to appear and become visible. Without one
+        it returns False straight away when no matching element exists, and a present element gets settle_timeout
+        seconds to become visible.
+
         Parameters:
             by: The method used to locate the element (e.g., By. ID, By.NAME, By.XPATH, etc.).
             value: The value of the method (e.g., the ID, name, or XPath expression).
+            timeout (int): The maximum time to wait for the element to be visible (default is None, no wait).
+            settle_timeout (int): The time a present element gets to become visible without a timeout (default 1s).
 
         Returns:
             bool: True if the element is displayed, False otherwise.
@@ -329,20 +846,31 @@ class BasePage:
         Usage:
             is_displayed = base_page.is_element_displayed(By.ID, 'exampleId')
         """
+        if timeout is None:
+            elements = self.driver.find_elements(by, value)
+            if not elements:
+                return False
+            condition, timeout = EC.visibility_of(elements[0]), settle_timeout
+        else:
+            condition = _VIS((by, value))
         try:
-            element = self.wait_for_visible_element(by, value)
-            return element.is_displayed()
-        except TimeoutException:
+            return self._wait(timeout).until(condition) is not False
+        except (TimeoutException, StaleElementReferenceException):
             return False
 
-    def is_element_clickable(self, by, value, timeout=10):
+    def is_element_clickable(self, by, value, timeout=None, settle_timeout=1):
         """
         Checks if an element identified by the specified method and value is clickable within a specified timeout.
 
+        With a timeout the check waits up to that long for the element to appear and become clickable. Without one
+        it returns False straight away when no matching element exists, and a present element gets settle_timeout
+        seconds to become clickable.
+
         Parameters:
             by: The method used to locate the element (e.g., By. ID, By.NAME, By.XPATH, etc.).
             value: The value of the method (e.g., the ID, name, or XPath expression).
-            timeout (int): The maximum time to wait for the element to be clickable (default is 10 seconds).
+            timeout (int): The maximum time to wait for the element to be clickable (default is None, no wait).
+            settle_timeout (int): The time a present element gets to become clickable without a timeout (default 1s).
 
         Returns:
             bool: True if the element is clickable, False otherwise.
@@ -350,14 +878,19 @@ class BasePage:
         Usage:
             is_clickable = base_page.is_element_clickable(By.ID, 'exampleId', timeout=5)
         """
+        if timeout is None:
+            elements = self.driver.find_elements(by, value)
+            if not elements:
+                return False
+            condition, timeout = _CLK(elements[0]), settle_timeout
+        else:
+            condition = _CLK((by, value))
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.element_to_be_clickable((by, value))
-            )
-            return True
-        except TimeoutException:
+            return self._wait(timeout).until(condition) is not False
+        except (TimeoutException, StaleElementReferenceException):
             return False
 
+    @_retry_stale()
     def is_element_enabled(self, by, value):
         """
         Checks if an element identified by the specified method and value is enabled.
@@ -372,9 +905,10 @@ class BasePage:
         Usage:
             is_enabled = base_page.is_element_enabled(By.ID, 'exampleId')
         """
-        element = self.wait_for_element(by, value)
+        element = self._find(by, value)
         return element.is_enabled()
 
+    @_retry_stale()
     def is_element_selected(self, by, value):
         """
         Checks if an element identified by the specified method and value is selected.
@@ -389,7 +923,7 @@ class BasePage:
         Usage:
             is_selected = base_page.is_element_selected(By.ID, 'exampleId')
         """
-        element = self.wait_for_element(by, value)
+        element = self._find(by, value)
         return element.is_selected()
 
     def get_page_title(self):
@@ -428,6 +962,24 @@ class BasePage:
         """
         return self.driver.current_url
 
+    def get_page_title_and_url(self):
+        """
+        Retrieves the title and URL of the current page in a single call.
+
+        Like get_page_title and get_current_url, this reports the top-level page; inside a frame it falls back to
+        those two calls, since the script would only see the frame's document.
+
+        Returns:
+            tuple: The (title, url) pair of the current page.
+
+        Usage:
+            page_title, current_url = base_page.get_page_title_and_url()
+        """
+        title, url, is_top_level = self.driver.execute_script(_WINDOW_META_SCRIPT)
+        if not is_top_level:
+            return self.driver.title, self.driver.current_url
+        return title, url
+
     def navigate_back(self):
         """
         Navigates the browser back one page.
@@ -435,6 +987,7 @@ class BasePage:
         Usage:
             base_page.navigate_back()
         """
+        self._elements.clear()
         self.driver.back()
 
     def navigate_forward(self):
@@ -444,6 +997,7 @@ class BasePage:
         Usage:
             base_page.navigate_forward()
         """
+        self._elements.clear()
         self.driver.forward()
 
     def refresh_page(self):
@@ -453,8 +1007,10 @@ class BasePage:
         Usage:
             base_page.refresh_page()
         """
+        self._elements.clear()
         self.driver.refresh()
 
+    @_retry_stale()
     def switch_to_frame(self, by, value):
         """
         Switches the focus to a frame identified by the specified method and value.
@@ -466,7 +1022,8 @@ class BasePage:
         Usage:
             base_page.switch_to_frame(By.ID, 'frameId')
         """
-        frame = self.wait_for_element(by, value)
+        frame = self._find(by, value)
+        self._elements.clear()
         self.driver.switch_to.frame(frame)
 
     def switch_to_default_content(self):
@@ -476,8 +1033,10 @@ class BasePage:
         Usage:
             base_page.switch_to_default_content()
         """
+        self._elements.clear()
         self.driver.switch_to.default_content()
 
+    @_mutates_page
     def execute_script(self, script, *args):
         """
         Executes JavaScript in the context of the current page.
@@ -494,19 +1053,31 @@ class BasePage:
         """
         return self.driver.execute_script(script, *args)
 
+    @_mutates_page
     def perform_keyboard_shortcut(self, *keys):
         """
         Performs a keyboard shortcut using the specified keys.
 
+        Modifier keys (Shift, Control, Alt, Meta/Command) are held down while the other keys are typed, and the
+        whole shortcut is sent as a single W3C actions request.
+
         Parameters:
             *keys: The keys to press for the shortcut.
 
         Usage:
             base_page.perform_keyboard_shortcut(Keys.CONTROL, 'a')  # Example: Select all
         """
+        modifiers = [key for key in keys if key in _MODIFIER_KEYS]
         actions = ActionChains(self.driver)
-        actions.send_keys(*keys).perform()
-
+        for modifier in modifiers:
+            actions.key_down(modifier)
+        actions.send_keys(*(key for key in keys if key not in _MODIFIER_KEYS))
+        for modifier in reversed(modifiers):
+            actions.key_up(modifier)
+        actions.perform()
+
+    @_mutates_page
+    @_retry_stale()
     def hover_over_element(self, by, value):
         """
         Hovers the mouse over an element identified by the specified method and value.
@@ -518,10 +1089,12 @@ class BasePage:
         Usage:
             base_page.hover_over_element(By.ID, 'exampleId')
         """
-        element = self.wait_for_element(by, value)
+        element = self._find(by, value)
         actions = ActionChains(self.driver)
         actions.move_to_element(element).perform()
 
+    @_mutates_page
+    @_retry_stale()
     def drag_and_drop(self, source_by, source_value, target_by, target_value):
         """
         Drags an element identified by the source method and value and drops it onto another element identified
@@ -536,22 +1109,44 @@ class BasePage:
         Usage:
             base_page.drag_and_drop(By.ID, 'sourceId', By. ID, 'targetId')
         """
-        source_element = self.wait_for_element(source_by, source_value)
-        target_element = self.wait_for_element(target_by, target_value)
+        source_element, target_element = self.find_many(
+            [(source_by, source_value), (target_by, target_value)]
+        )
         actions = ActionChains(self.driver)
         actions.drag_and_drop(source_element, target_element).perform()
 
-    def capture_screenshot(self, filename):
+    def capture_screenshot(self, filename, fmt=None, quality=60, clip=None):
         """
         Captures a screenshot of the current page and saves it to the specified filename.
 
+        On Chromium-based drivers the screenshot is taken with CDP Page.captureScreenshot, which can encode JPEG and
+        crop to a region. Other drivers fall back to the WebDriver screenshot command, which always produces PNG.
+
         Parameters:
             filename (str): The filename (with path) to save the screenshot.
-
-        Usage:
-            base_page.capture_screenshot("path/to/screenshot.png")
-        """
-        self.driver.save_screenshot(filename)
+            fmt (str or None): 'jpeg', 'png' or 'webp'. Defaults to 'png' for filenames ending in '.png' and to
+                'jpeg' otherwise.
+            quality (int): The compression quality for JPEG and WebP, from 0 to 100 (default is 60).
+            clip (tuple or None): An optional (x, y, width, height) region of the page to capture, in CSS pixels.
+
+        Usage:
+            base_page.capture_screenshot("path/to/screenshot.jpg")
+            base_page.capture_screenshot("path/to/header.png", clip=(0, 0, 1200, 200))
+        """
+        if not hasattr(self.driver, "execute_cdp_cmd"):
+            self.driver.save_screenshot(filename)
+            return
+        if fmt is None:
+            fmt = "png" if filename.lower().endswith(".png") else "jpeg"
+        params = {"format": fmt, "captureBeyondViewport": False}
+        if fmt != "png":
+            params["quality"] = quality
+        if clip is not None:
+            x, y, width, height = clip
+            params["clip"] = {"x": x, "y": y, "width": width, "height": height, "scale": 1}
+        data = self._cdp("Page.captureScreenshot", params)["data"]
+        with open(filename, "wb") as file:
+            file.write(base64.b64decode(data))
 
     def close_browser(self):
         """
@@ -560,6 +1155,7 @@ class BasePage:
         Usage:
             base_page.close_browser()
         """
+        self._elements.clear()
         self.driver.close()
 
     def quit_browser(self):
@@ -569,9 +1165,10 @@ class BasePage:
         Usage:
             base_page.quit_browser()
         """
+        self._http.close()
         self.driver.quit()
 
-    def wait_for_alert(self, timeout=10):
+    def wait_for_alert(self, timeout=DEFAULT_TIMEOUT):
         """
         Waits for an alert to be present within the specified timeout and returns the Alert object.
 
@@ -584,21 +1181,26 @@ class BasePage:
         Usage:
             alert = base_page.wait_for_alert()
         """
-        return WebDriverWait(self.driver, timeout).until(EC.alert_is_present())
+        return self._alert(timeout)
 
-    def wait_for_alert_to_be_present(self, timeout=10):
+    def wait_for_alert_to_be_present(self, timeout=DEFAULT_TIMEOUT):
         """
         Waits for an alert to be present.
 
+        Deprecated: use wait_for_alert, which behaves identically.
+
         Parameters:
             timeout (int): The maximum time to wait for the condition (default is 10 seconds).
 
         Usage:
             base_page.wait_for_alert_to_be_present(timeout=15)
         """
-        return WebDriverWait(self.driver, timeout).until(
-            EC.alert_is_present()
+        warnings.warn(
+            "wait_for_alert_to_be_present is deprecated, use wait_for_alert instead",
+            DeprecationWarning,
+            stacklevel=2,
         )
+        return self._alert(timeout)
 
     def switch_to_alert(self):
         """
@@ -619,7 +1221,7 @@ class BasePage:
         Usage:
             base_page.accept_alert()
         """
-        alert = self.wait_for_alert()
+        alert = self._alert()
         alert.accept()
 
     def get_alert_text(self):
@@ -632,7 +1234,7 @@ class BasePage:
         Usage:
             alert_text = base_page.get_alert_text()
         """
-        alert = self.wait_for_alert()
+        alert = self._alert()
         return alert.text
 
     def switch_to_frame_by_index(self, frame_index):
@@ -645,6 +1247,7 @@ class BasePage:
         Usage:
             base_page.switch_to_frame_by_index(0)
         """
+        self._elements.clear()
         self.driver.switch_to.frame(frame_index)
 
     def switch_to_frame_by_name_or_id(self, frame_name_or_id):
@@ -657,6 +1260,7 @@ class BasePage:
         Usage:
             base_page.switch_to_frame_by_name_or_id('exampleFrame')
         """
+        self._elements.clear()
         self.driver.switch_to.frame(frame_name_or_id)
 
     def switch_to_parent_frame(self):
@@ -666,8 +1270,46 @@ class BasePage:
         Usage:
             base_page.switch_to_parent_frame()
         """
+        self._elements.clear()
         self.driver.switch_to.parent_frame()
 
+    def switch_to_frame_path(self, *frame_names):
+        """
+        Switches the focus from the top-level document down through nested frames identified by name.
+
+        On Chromium-based drivers the frame tree is fetched once with CDP Page.getFrameTree and each level is
+        switched to by index, so no element lookups are needed. If the tree cannot be matched, or the frame reached
+        does not carry the expected name, the switch falls back to looking up each frame by name or ID.
+
+        Parameters:
+            *frame_names (str): The names of the frames to descend into, outermost first.
+
+        Usage:
+            base_page.switch_to_frame_path('outerFrame', 'innerFrame')
+        """
+        self._elements.clear()
+        self.driver.switch_to.default_content()
+        if not frame_names:
+            return
+        if hasattr(self.driver, "execute_cdp_cmd"):
+            tree = self._cdp("Page.getFrameTree", {})["frameTree"]
+            indexes = []
+            for name in frame_names:
+                children = tree.get("childFrames", [])
+                index = next((i for i, child in enumerate(children) if child["frame"].get("name") == name), None)
+                if index is None:
+                    break
+                indexes.append(index)
+                tree = children[index]
+            else:
+                for index in indexes:
+                    self.driver.switch_to.frame(index)
+                if self.driver.execute_script("return window.name;") == frame_names[-1]:
+                    return
+                self.driver.switch_to.default_content()
+        for name in frame_names:
+            self.driver.switch_to.frame(name)
+
     def switch_to_window(self, window_handle):
         """
         Switches the focus to a window with the specified window handle.
@@ -678,6 +1320,7 @@ class BasePage:
         Usage:
             base_page.switch_to_window('exampleHandle')
         """
+        self._elements.clear()
         self.driver.switch_to.window(window_handle)
 
     def get_all_window_handles(self):
@@ -719,6 +1362,7 @@ class BasePage:
         """
         window_handles = self.driver.window_handles
         if window_index < len(window_handles):
+            self._elements.clear()
             self.driver.switch_to.window(window_handles[window_index])
         else:
             raise IndexError(f"Window index {window_index} is out of range.")
@@ -726,6 +1370,7 @@ class BasePage:
     def switch_to_window_by_title(self, window_title):
         """
         Switches the focus to a window with the specified title.
+        If no window matches, the focus stays on the original window.
 
         Parameters:
             window_title (str): The title of the window to switch to.
@@ -736,17 +1381,13 @@ class BasePage:
         Usage:
             base_page.switch_to_window_by_title('Example Window Title')
         """
-        current_handle = self.driver.current_window_handle
-        for handle in self.driver.window_handles:
-            if handle != current_handle:
-                self.driver.switch_to.window(handle)
-                if window_title in self.driver.title:
-                    return
-        raise NoSuchWindowException(f"No window with title '{window_title}' found.")
+        if not self._switch_to_window_matching(0, window_title):
+            raise NoSuchWindowException(f"No window with title '{window_title}' found.")
 
     def switch_to_window_by_url(self, window_url):
         """
         Switches the focus to a window with the specified URL.
+        If no window matches, the focus stays on the original window.
 
         Parameters:
             window_url (str): The URL of the window to switch to.
@@ -757,14 +1398,10 @@ class BasePage:
         Usage:
             base_page.switch_to_window_by_url('http://example.com')
         """
-        current_handle = self.driver.current_window_handle
-        for handle in self.driver.window_handles:
-            if handle != current_handle:
-                self.driver.switch_to.window(handle)
-                if window_url in self.driver.current_url:
-                    return
-        raise NoSuchWindowException(f"No window with URL '{window_url}' found.")
+        if not self._switch_to_window_matching(1, window_url):
+            raise NoSuchWindowException(f"No window with URL '{window_url}' found.")
 
+    @_retry_stale()
     def scroll_into_view(self, by, value):
         """
         Scrolls the page to bring the specified element into view.
@@ -776,9 +1413,15 @@ class BasePage:
         Usage:
             base_page.scroll_into_view(By.ID, 'exampleId')
         """
-        element = self.wait_for_element(by, value)
+        # execute_script runs in the current frame, unlike CDP Runtime.evaluate, and still costs one round-trip.
+        if by in SCRIPT_LOCATORS:
+            if self.driver.execute_script(_SCROLL_INTO_VIEW_SCRIPT % lookup_expression(by, value)):
+                return
+        element = self._find(by, value)
         self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
 
+    @_mutates_page
+    @_retry_stale()
     def perform_double_click(self, by, value):
         """
         Performs a double click on the specified element.
@@ -790,10 +1433,12 @@ class BasePage:
         Usage:
             base_page.perform_double_click(By.ID, 'exampleId')
         """
-        element = self.wait_for_element(by, value)
+        element = self._find(by, value)
         actions = ActionChains(self.driver)
         actions.double_click(element).perform()
 
+    @_mutates_page
+    @_retry_stale()
     def perform_right_click(self, by, value):
         """
         Performs a right-click on the specified element.
@@ -805,10 +1450,12 @@ class BasePage:
         Usage:
             base_page.perform_right_click(By.ID, 'exampleId')
         """
-        element = self.wait_for_element(by, value)
+        element = self._find(by, value)
         actions = ActionChains(self.driver)
         actions.context_click(element).perform()
 
+    @_mutates_page
+    @_retry_stale()
     def upload_file(self, by, value, file_path):
         """
         Uploads a file to the specified input element.
@@ -821,13 +1468,17 @@ class BasePage:
         Usage:
             base_page.upload_file(By.ID, 'fileInput', '/path/to/file.txt')
         """
-        element = self.wait_for_element(by, value)
+        element = self._find(by, value)
         element.send_keys(file_path)
 
     def download_file(self, url, destination_path):
         """
         Downloads a file from the given URL to the specified destination path.
 
+        The browser session's cookies are sent along so authenticated downloads work, but only to hosts and paths
+        they are scoped to, and the response is streamed to disk in chunks over a connection pool that is reused
+        across downloads.
+
         Parameters:
             url (str): The URL of the file to download.
             destination_path (str): The path where the downloaded file should be saved.
@@ -835,11 +1486,19 @@ class BasePage:
         Usage:
             base_page.download_file('http://example.com/file.zip', '/path/to/save/file.zip')
         """
-        # Code to download a file from a URL to a specified destination path
-        # This might involve using the 'requests' library or other appropriate method
-        pass
+        cookies = requests.cookies.RequestsCookieJar()
+        for cookie in self.get_all_cookies():
+            cookies.set_cookie(requests.cookies.create_cookie(
+                cookie['name'], cookie['value'], domain=cookie['domain'], path=cookie['path'],
+                secure=cookie.get('secure', False),
+            ))
+        with self._http.get(url, stream=True, cookies=cookies) as response:
+            response.raise_for_status()
+            with open(destination_path, 'wb', buffering=1 << 20) as file:
+                for chunk in response.iter_content(chunk_size=1 << 16):
+                    file.write(chunk)
 
-    def wait_for_elements(self, by, value, timeout=10):
+    def wait_for_elements(self, by, value, timeout=DEFAULT_TIMEOUT):
         """
         Waits for the presence of all elements identified by the specified method and value.
 
@@ -854,14 +1513,17 @@ class BasePage:
         Usage:
             elements = base_page.wait_for_elements(By.CLASS_NAME, 'exampleClass')
         """
-        return WebDriverWait(self.driver, timeout).until(
-            EC.presence_of_all_elements_located((by, value))
+        return self._wait(timeout).until(
+            _ALL((by, value))
         )
 
+    @_mutates_page
     def click_elements(self, by, value, index=None):
         """
         Clicks on one or multiple elements identified by the specified method and value.
 
+        CSS selectors are resolved and clicked in a single script call once matching elements are present.
+
         Parameters:
             by: The method used to locate the elements (e.g., By. ID, By.NAME, By.XPATH, etc.).
             value: The value of the method (e.g., the ID, name, or XPath expression) identifying the elements.
@@ -871,6 +1533,12 @@ class BasePage:
             base_page.click_elements(By.CLASS_NAME, 'exampleClass')
             base_page.click_elements(By.XPATH, '//button', index=0)
         """
+        if by == By.CSS_SELECTOR and (index is None or index >= 0):
+            count = self.driver.execute_script(_CLICK_ALL_SCRIPT, value, index)
+            if count:
+                if index is not None and index >= count:
+                    raise IndexError(f"Element index {index} is out of range.")
+                return
         elements = self.wait_for_elements(by, value)
         if index is not None:
             elements[index].click()
@@ -895,6 +1563,7 @@ class BasePage:
         elements = self.wait_for_elements(by, value)
         return len(elements)
 
+    @_mutates_page
     def execute_async_script(self, script, *args):
         """
         Executes asynchronous JavaScript in the context of the current page.
@@ -941,6 +1610,7 @@ class BasePage:
         """
         self.driver.execute_script("window.scrollTo(0, 0);")
 
+    @_retry_stale()
     def scroll_to_element(self, by, value):
         """
         Scrolls the page to bring the specified element into view.
@@ -952,9 +1622,27 @@ class BasePage:
         Usage:
             base_page.scroll_to_element(By.ID, 'exampleId')
         """
-        element = self.wait_for_element(by, value)
+        element = self._find(by, value)
         self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
 
+    @_mutates_page
+    @_retry_stale()
+    def scroll_and_click(self, by, value):
+        """
+        Scrolls the specified element to the centre of the viewport without animation and clicks it, in one call.
+
+        Parameters:
+            by: The method used to locate the element (e.g., By. ID, By.NAME, By.XPATH, etc.).
+            value: The value of the method (e.g., the ID, name, or XPath expression).
+
+        Usage:
+            base_page.scroll_and_click(By.ID, 'exampleId')
+        """
+        element = self._find(by, value)
+        self.driver.execute_script(_SCROLL_AND_CLICK_SCRIPT, element)
+
+    @_mutates_page
+    @_retry_stale()
     def drag_and_drop_by_offset(self, by, value, x_offset, y_offset):
         """
         Drags an element identified by the specified method and value and drops it at the specified offset.
@@ -968,10 +1656,29 @@ class BasePage:
         Usage:
             base_page.drag_and_drop_by_offset(By.ID, 'exampleId', 50, 50)
         """
-        element = self.wait_for_element(by, value)
+        element = self._find(by, value)
         actions = ActionChains(self.driver)
         actions.drag_and_drop_by_offset(element, x_offset, y_offset).perform()
 
+    @_mutates_page
+    @_retry_stale()
+    def press_key(self, by, value, key):
+        """
+        Presses a key on the specified element.
+
+        Every press looks the element up again: a keystroke can change which element matches the locator (e.g., an
+        arrow key moving '.active' in a list), so the element cache is dropped after each one.
+
+        Parameters:
+            by: The method used to locate the element (e.g., By. ID, By.NAME, By.XPATH, etc.).
+            value: The value of the method (e.g., the ID, name, or XPath expression).
+            key: The key to press (e.g., Keys.ENTER or a single character).
+
+        Usage:
+            base_page.press_key(By.ID, 'exampleId', Keys.ARROW_DOWN)
+        """
+        self._find(by, value).send_keys(key)
+
     def press_enter_key(self, by, value):
         """
         Presses the Enter key on the specified element.
@@ -983,8 +1690,7 @@ class BasePage:
         Usage:
             base_page.press_enter_key(By.ID, 'exampleId')
         """
-        element = self.wait_for_element(by, value)
-        element.send_keys(Keys.ENTER)
+        self.press_key(by, value, Keys.ENTER)
 
     def press_tab_key(self, by, value):
         """
@@ -997,8 +1703,7 @@ class BasePage:
         Usage:
             base_page.press_tab_key(By.ID, 'exampleId')
         """
-        element = self.wait_for_element(by, value)
-        element.send_keys(Keys.TAB)
+        self.press_key(by, value, Keys.TAB)
 
     def press_escape_key(self, by, value):
         """
@@ -1011,21 +1716,26 @@ class BasePage:
         Usage:
             base_page.press_escape_key(By.ID, 'exampleId')
         """
-        element = self.wait_for_element(by, value)
-        element.send_keys(Keys.ESCAPE)
+        self.press_key(by, value, Keys.ESCAPE)
 
-    def take_screenshot(self, filename):
+    def take_screenshot(self, filename, fmt=None, quality=60):
         """
         Takes a screenshot of the current page and saves it to the specified filename.
 
+        Same as capture_screenshot: JPEG through CDP unless the filename ends in '.png', so failure artifacts saved
+        as PNG stay lossless.
+
         Parameters:
             filename (str): The filename (with path) to save the screenshot.
+            fmt (str or None): 'jpeg', 'png' or 'webp'; defaults to the format implied by the filename.
+            quality (int): The compression quality for JPEG and WebP, from 0 to 100 (default is 60).
 
         Usage:
-            base_page.take_screenshot("path/to/screenshot.png")
+            base_page.take_screenshot("path/to/screenshot.jpg")
         """
-        self.driver.save_screenshot(filename)
+        self.capture_screenshot(filename, fmt=fmt, quality=quality)
 
+    @_retry_stale()
     def get_dropdown_options(self, by, value):
         """
         Retrieves the options available in a dropdown identified by the specified method and value.
@@ -1040,27 +1750,38 @@ class BasePage:
         Usage:
             options = base_page.get_dropdown_options(By.ID, 'exampleDropdown')
         """
-        element = self.wait_for_element(by, value)
-        select = Select(element)
-        return [option.text for option in select.options]
+        element = self._find(by, value)
+        return self.driver.execute_script(_OPTION_TEXTS_SCRIPT, element)
 
+    @_mutates_page
+    @_retry_stale()
     def select_multiple_dropdown_options(self, by, value, options):
         """
         Selects multiple options in a dropdown identified by the specified method and value.
 
+        All options are selected in one script call, followed by a single 'input' and 'change' event. Nothing is
+        selected if any option is missing or disabled.
+
         Parameters:
             by: The method used to locate the element (e.g., By. ID, By.NAME, By.XPATH, etc.).
             value: The value of the method (e.g., the ID, name, or XPath expression).
             options (List[str]): A list of option texts to select.
 
+        Raises:
+            NoSuchElementException: If no option has one of the given texts.
+            NotImplementedError: If one of the options is disabled, as Select.select_by_visible_text raises.
+
         Usage:
             base_page.select_multiple_dropdown_options(By.ID, 'exampleDropdown', ['Option1', 'Option2'])
         """
-        element = self.wait_for_element(by, value)
-        select = Select(element)
-        for option in options:
-            select.select_by_visible_text(option)
+        element = self._find(by, value)
+        result = self.driver.execute_script(_SELECT_OPTIONS_SCRIPT, element, list(options))
+        if result["missing"]:
+            raise NoSuchElementException(f"Could not locate element with visible text: {result['missing'][0]}")
+        if result["disabled"]:
+            raise NotImplementedError(f"You may not select a disabled option: {result['disabled'][0]}")
 
+    @_retry_stale()
     def get_attribute_value(self, by, value, attribute):
         """
         Retrieves the value of the specified attribute from the element.
@@ -1076,10 +1797,10 @@ class BasePage:
         Usage:
             value = base_page.get_attribute_value(By.ID, 'exampleId', 'data-custom-attribute')
         """
-        element = self.wait_for_element(by, value)
+        element = self._find(by, value)
         return element.get_attribute(attribute)
 
-    def wait_for_url_to_contain(self, partial_url, timeout=10):
+    def wait_for_url_to_contain(self, partial_url, timeout=DEFAULT_TIMEOUT):
         """
         Waits for the URL to contain the specified partial URL.
 
@@ -1090,11 +1811,9 @@ class BasePage:
         Usage:
             base_page.wait_for_url_to_contain('example', timeout=15)
         """
-        return WebDriverWait(self.driver, timeout).until(
-            EC.url_contains(partial_url)
-        )
+        return self._wait_for_url(partial_url, False, timeout)
 
-    def wait_for_url_to_match(self, full_url, timeout=10):
+    def wait_for_url_to_match(self, full_url, timeout=DEFAULT_TIMEOUT):
         """
         Waits for the URL to match the specified full URL.
 
@@ -1105,10 +1824,10 @@ class BasePage:
         Usage:
             base_page.wait_for_url_to_match('http://example.com', timeout=15)
         """
-        return WebDriverWait(self.driver, timeout).until(
-            EC.url_to_be(full_url)
-        )
+        return self._wait_for_url(full_url, True, timeout)
 
+    @_mutates_page
+    @_retry_stale()
     def hover_and_click(self, hover_by, hover_value, click_by, click_value):
         """
         Hovers over an element and clicks another element.
@@ -1122,13 +1841,11 @@ class BasePage:
         Usage:
             base_page.hover_and_click(By.ID, 'hoverElementId', By.NAME, 'clickElementName')
         """
-        hover_element = self.wait_for_element(hover_by, hover_value)
-        click_element = self.wait_for_element(click_by, click_value)
-
+        hover_element, click_element = self.find_many([(hover_by, hover_value), (click_by, click_value)])
         actions = ActionChains(self.driver)
         actions.move_to_element(hover_element).click(click_element).perform()
 
-    def wait_for_text_to_be_present_in_element(self, by, value, text, timeout=10):
+    def wait_for_text_to_be_present_in_element(self, by, value, text, timeout=DEFAULT_TIMEOUT):
         """
         Waits for the specified text to be present in the identified element.
 
@@ -1141,11 +1858,11 @@ class BasePage:
         Usage:
             base_page.wait_for_text_to_be_present_in_element(By.ID, 'exampleId', 'expectedText', timeout=15)
         """
-        return WebDriverWait(self.driver, timeout).until(
+        return self._wait(timeout).until(
             EC.text_to_be_present_in_element((by, value), text)
         )
 
-    def wait_for_text_to_be_present_in_element_value(self, by, value, text, timeout=10):
+    def wait_for_text_to_be_present_in_element_value(self, by, value, text, timeout=DEFAULT_TIMEOUT):
         """
         Waits for the specified text to be present in the value of the identified element.
 
@@ -1158,10 +1875,12 @@ class BasePage:
         Usage:
             base_page.wait_for_text_to_be_present_in_element_value(By.ID, 'exampleId', 'expectedText', timeout=15)
         """
-        return WebDriverWait(self.driver, timeout).until(
+        return self._wait(timeout).until(
             EC.text_to_be_present_in_element_value((by, value), text)
         )
 
+    @_mutates_page
+    @_retry_stale()
     def upload_file_using_input(self, by, value, file_path):
         """
         Uploads a file to the specified input element using the input field.
@@ -1174,5 +1893,5 @@ class BasePage:
         Usage:
             base_page.upload_file_using_input(By.ID, 'fileInputId', '/path/to/file.txt')
         """
-        element = self.wait_for_element(by, value)
+        element = self._find(by, value)
         element.send_keys(file_path)
\ No newline at end of file
@@ -1,15 +1,33 @@
+from selenium.webdriver.support.select import Select
+
 from Pages.basepage import BasePage
-from locators.home_page_locators import HomePageLocators
+from locators.home_page_locators import LOC
 
 class HomePage(BasePage):
     def select_room(self):
-        self.select_dropdown_option_by_value(*HomePageLocators.Select_room)
+        self.select_dropdown_option_by_value(LOC.select_room_by, LOC.select_room_value)
 
     def set_start_time(self):
-        self.click_element(*HomePageLocators.Start_time)
+        self.click_element(LOC.start_time_by, LOC.start_time_value)
 
     def set_end_time(self):
-        self.click_element(*HomePageLocators.End_time)
+        self.click_element(LOC.end_time_by, LOC.end_time_value)
 
     def click_room_book_button(self):
-        self.click_element(*HomePageLocators.Book_room_button)
\ No newline at end of file
+        self.click_element(LOC.book_room_button_by, LOC.book_room_button_value)
+
+    def book_room(self, room):
+        room_select, start_time, end_time, book_button = self.find_many([
+            (LOC.select_room_by, LOC.select_room_value),
+            (LOC.start_time_by, LOC.start_time_value),
+            (LOC.end_time_by, LOC.end_time_value),
+            (LOC.book_room_button_by, LOC.book_room_button_value),
+        ])
+        try:
+            Select(room_select).select_by_value(room)
+            start_time.click()
+            end_time.click()
+            book_button.click()
+        finally:
+            # The booking changes the page, so later lookups must not reuse the elements found above.
+            self._elements.clear()
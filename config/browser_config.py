@@ -1,5 +1,15 @@
 class BrowserConfig:
     BROWSER_NAME = 'firefox'
     HEADLESS_MODE = "--headless"
+    # Skip downloading images when the tests do not assert on them.
+    LOAD_IMAGES = False
+    # Third-party requests blocked in Chromium; none of them are exercised by the tests. The block list is set on
+    # the first tab only, so windows a test opens later still load these URLs.
+    BLOCKED_URLS = ["*.doubleclick.net", "*.google-analytics.com", "*.googletagmanager.com"]
 
-    DEFAULT_TIMEOUT = 20
\ No newline at end of file
+    DEFAULT_TIMEOUT = 20
+
+    # Browsers started per test session (per pytest-xdist worker) and reused across tests.
+    POOL_SIZE = 1
+    # Seconds a test waits for a pooled browser before failing, so a leaked driver cannot hang the worker.
+    POOL_TIMEOUT = 120
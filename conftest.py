@@ -1,30 +1,128 @@
+import queue
+
 import pytest
 from selenium import webdriver
+from selenium.common import WebDriverException
 from config.browser_config import BrowserConfig
 
 
-@pytest.fixture
-def setup():
+def create_driver():
+    """
+    Creates a new WebDriver for the browser configured in BrowserConfig.
+
+    Each call starts an independent browser, so the function can be handed to BasePage.for_parallel or
+    called once per pytest-xdist worker (``pytest -n auto``) without sharing state between drivers.
+    """
     if BrowserConfig.BROWSER_NAME == 'chrome':
         chrome_options = webdriver.ChromeOptions()
         if BrowserConfig.HEADLESS_MODE:
             chrome_options.add_argument('--headless')
-        driver = webdriver.Chrome(chrome_options)
+        chrome_options.add_argument('--disable-gpu')
+        chrome_options.add_argument('--no-sandbox')
+        chrome_options.add_argument('--disable-dev-shm-usage')
+        prefs = {"profile.default_content_setting_values.notifications": 2}
+        if not BrowserConfig.LOAD_IMAGES:
+            chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+            prefs["profile.managed_default_content_settings.images"] = 2
+        chrome_options.add_experimental_option("prefs", prefs)
+        driver = webdriver.Chrome(options=chrome_options)
+        # These CDP settings apply to the first tab only; windows a test opens later run without them.
+        driver.execute_cdp_cmd("Network.enable", {})
+        if BrowserConfig.BLOCKED_URLS:
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BrowserConfig.BLOCKED_URLS})
+        # Pin the page environment so no throttling or script toggles leak into timing between runs.
+        driver.execute_cdp_cmd("Network.emulateNetworkConditions", {
+            "offline": False, "latency": 0, "downloadThroughput": -1, "uploadThroughput": -1,
+        })
+        # WebDriver scripts are not subject to page CSP anyway; this makes the app under test itself run without
+        # its Content-Security-Policy, so the suite cannot catch CSP regressions.
+        driver.execute_cdp_cmd("Page.setBypassCSP", {"enabled": True})
+        driver.execute_cdp_cmd("Emulation.setScriptExecutionDisabled", {"value": False})
 
     elif BrowserConfig.BROWSER_NAME == 'firefox':
         firefox_options = webdriver.FirefoxOptions()
         if BrowserConfig.HEADLESS_MODE:
             firefox_options.add_argument('--headless')
-        driver = webdriver.Chrome(firefox_options)
+        driver = webdriver.Firefox(options=firefox_options)
 
     elif BrowserConfig.BROWSER_NAME == 'edge':
         edge_options = webdriver.EdgeOptions()
         if BrowserConfig.HEADLESS_MODE:
             edge_options.add_argument('--headless')
-        driver = webdriver.Chrome(edge_options)
+        driver = webdriver.Edge(options=edge_options)
 
     else:
         raise ValueError("Unsupported Browser!!")
 
+    # BasePage relies on explicit waits only; an implicit wait would stall every absence check.
+    driver.implicitly_wait(0)
+    return driver
+
+
+@pytest.fixture(scope="session")
+def driver_factory():
+    return create_driver
+
+
+@pytest.fixture(scope="session")
+def driver_pool(driver_factory):
+    """
+    Starts BrowserConfig.POOL_SIZE browsers once per session (once per pytest-xdist worker) and shares them
+    between tests.
+    """
+    pool = queue.Queue()
+    for _ in range(BrowserConfig.POOL_SIZE):
+        pool.put(driver_factory())
+    yield pool
+    # setup may have replaced broken drivers, so quit whatever is in the pool now.
+    while not pool.empty():
+        pool.get_nowait().quit()
+
+
+def clear_storage(driver):
+    """
+    Clears localStorage and sessionStorage of the page the driver is on.
+    """
+    try:
+        driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+    except WebDriverException:
+        # Pages without storage access (e.g. about:blank or data: URLs) have nothing to clear.
+        pass
+
+
+@pytest.fixture
+def setup(driver_pool, driver_factory):
+    """
+    Lends a pooled driver to the test and cleans it up before returning it to the pool.
+
+    Storage is cleared for the pages open when the test ends; storage of origins the test navigated away from
+    survives into the next test on the same browser. Cookies are cleared for every origin on Chromium-based browsers
+    and only for the current page's origin elsewhere.
+    """
+    try:
+        driver = driver_pool.get(timeout=BrowserConfig.POOL_TIMEOUT)
+    except queue.Empty:
+        pytest.fail(f"No pooled browser was returned within {BrowserConfig.POOL_TIMEOUT}s; a driver leaked.")
     yield driver
-    driver.quit()
+    try:
+        handles = driver.window_handles
+        for handle in reversed(handles):
+            driver.switch_to.window(handle)
+            clear_storage(driver)
+            if handle != handles[0]:
+                driver.close()
+        driver.switch_to.window(handles[0])
+        if hasattr(driver, "execute_cdp_cmd"):
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        else:
+            driver.delete_all_cookies()
+        driver.get("about:blank")
+    except WebDriverException:
+        # The test left an alert open, closed the browser or crashed it; start a fresh one in its place.
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+        driver_pool.put(driver_factory())
+    else:
+        driver_pool.put(driver)
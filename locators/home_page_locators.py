@@ -1,3 +1,5 @@
+from dataclasses import dataclass
+
 from selenium.webdriver.common.by import By
 
 
@@ -5,4 +7,21 @@ class HomePageLocators:
     Select_room = (By.CSS_SELECTOR, "select#room")
     Start_time = (By.CSS_SELECTOR, "input#start-time")
     End_time = (By.CSS_SELECTOR, "input#end-time")
-    Book_room_button = (By.CSS_SELECTOR, "#booking-form button")
\ No newline at end of file
+    Book_room_button = (By.CSS_SELECTOR, "#booking-form button")
+
+
+@dataclass(frozen=True, slots=True)
+class _HomePageLocators:
+    # The same locators with strategy and value split into slot attributes, so page methods can pass them
+    # without unpacking a tuple on every call.
+    select_room_by: str = HomePageLocators.Select_room[0]
+    select_room_value: str = HomePageLocators.Select_room[1]
+    start_time_by: str = HomePageLocators.Start_time[0]
+    start_time_value: str = HomePageLocators.Start_time[1]
+    end_time_by: str = HomePageLocators.End_time[0]
+    end_time_value: str = HomePageLocators.End_time[1]
+    book_room_button_by: str = HomePageLocators.Book_room_button[0]
+    book_room_button_value: str = HomePageLocators.Book_room_button[1]
+
+
+LOC = _HomePageLocators()
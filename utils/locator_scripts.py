@@ -0,0 +1,62 @@
+import functools
+import json
+
+from selenium.webdriver.common.by import By
+
+# Locator strategies that can be resolved inside the page with plain DOM calls.
+SCRIPT_LOCATORS = (By.ID, By.CSS_SELECTOR, By.XPATH)
+
+
+@functools.lru_cache(maxsize=256)
+def lookup_expression(by, value):
+    """
+    Builds a JavaScript expression that evaluates to the element identified by the locator, or null.
+
+    Expressions are cached per locator, since tests issue the same locators over and over.
+
+    Parameters:
+        by: The method used to locate the element (By.ID, By.CSS_SELECTOR or By.XPATH).
+        value: The value of the method (e.g., the ID, CSS selector, or XPath expression).
+
+    Raises:
+        ValueError: If the locator strategy cannot be evaluated in the page.
+    """
+    literal = json.dumps(value)
+    if by == By.ID:
+        return f"document.getElementById({literal})"
+    if by == By.CSS_SELECTOR:
+        return f"document.querySelector({literal})"
+    if by == By.XPATH:
+        return (f"document.evaluate({literal}, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null)"
+                ".singleNodeValue")
+    raise ValueError(f"Unsupported locator strategy for in-page lookup: {by}")
+
+
+@functools.lru_cache(maxsize=256)
+def resolve_many_script(locators):
+    """
+    Builds a script that returns the elements (or null) for several locators as one array.
+
+    Parameters:
+        locators (tuple): A tuple of (by, value) pairs, each using one of SCRIPT_LOCATORS.
+    """
+    return "return [%s];" % ", ".join(lookup_expression(by, value) for by, value in locators)
+
+
+# Sets the value through the prototype's setter so frameworks that track the property (e.g., React) see the change,
+# then fires 'input' and 'change'. Returns false, leaving the element untouched, when the element is not an editable
+# text field (e.g., contenteditable, file inputs, readonly or disabled fields), so callers can type the text instead.
+SET_VALUE_FUNCTION = """function (text) {
+    var tag = this.tagName.toLowerCase();
+    if ((tag !== 'input' && tag !== 'textarea') || this.type === 'file' || this.readOnly || this.matches(':disabled')) {
+        return false;
+    }
+    var descriptor = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(this), 'value');
+    if (!descriptor || !descriptor.set) {
+        return false;
+    }
+    descriptor.set.call(this, text);
+    this.dispatchEvent(new Event('input', {bubbles: true}));
+    this.dispatchEvent(new Event('change', {bubbles: true}));
+    return true;
+}"""